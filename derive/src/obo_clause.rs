@@ -59,6 +59,23 @@ impl OboClauseVariant {
         }
     }
 
+    /// Make the expression writing the tag of the clause followed by a colon.
+    ///
+    /// When the tag is known at compile time, the colon is appended to the
+    /// string literal so that the whole prefix is written in a single call.
+    pub fn fmt_tag(&self) -> syn::Expr {
+        let tag_str = match &self.tag {
+            Some(syn::Lit::Str(s)) => s.value(),
+            None => self.ident.to_string().to_snake_case(),
+            Some(_) => {
+                let tag = self.tag();
+                return parse_quote!(f.write_str(#tag).and(f.write_char(':')));
+            }
+        };
+        let prefix = syn::LitStr::new(&format!("{}:", tag_str), self.ident.span());
+        parse_quote!(f.write_str(#prefix))
+    }
+
     pub fn cardinality(&self) -> Cow<syn::Path> {
         match &self.cardinality {
             Some(s) => Cow::Borrowed(s),
@@ -70,7 +87,7 @@ impl OboClauseVariant {
     pub fn fmt_arms(&self) -> Vec<syn::Arm> {
         // Extract ident and tag to use in `quote!` calls.
         let id = &self.ident;
-        let tag = self.tag();
+        let fmt_tag = self.fmt_tag();
 
         if let Some(fmt_string) = self.format.as_ref() {
             // If an explicit format string is given, use that string
@@ -105,11 +122,11 @@ impl OboClauseVariant {
             //
             vec![
                 parse_quote! {
-                    #id( #(#c1_none,)* ) => f.write_str(#tag).and(f.write_char(':'))
+                    #id( #(#c1_none,)* ) => #fmt_tag
                         #(.and(f.write_char(' ')).and(#c2_none.fmt(f)))*,
                 },
                 parse_quote! {
-                    #id( #(#c1_some,)* ) => f.write_str(#tag).and(f.write_char(':'))
+                    #id( #(#c1_some,)* ) => #fmt_tag
                         #(.and(f.write_char(' ')).and(#c2_some.fmt(f)))*,
                 },
             ]
@@ -118,7 +135,7 @@ impl OboClauseVariant {
             let c1 = &catches;
             let c2 = &catches;
             vec![parse_quote! {
-                #id( #(ref #c1,)* ) => f.write_str(#tag).and(f.write_char(':'))
+                #id( #(ref #c1,)* ) => #fmt_tag
                     #(.and(f.write_char(' ')).and(#c2.fmt(f)))*,
             }]
         }
@@ -300,18 +300,9 @@ pub enum IsoTimezone {
 impl DateTime for IsoDateTime {
     /// Generate an XML Schema datetime serialization of the `IsoDateTime`.
     fn to_xsd_datetime(&self) -> String {
-        let tz = match self.timezone() {
-            None => String::new(),
-            Some(dt) => dt.to_string(),
-        };
-        let fraction = match self.fraction() {
-            None => String::new(),
-            Some(frac) => format!("{:0.02}", frac)[1..].to_string(),
-        };
-        format!(
-            "{:04}-{:02}-{:02}T{:02}:{:02}:{:02}{}{}",
-            self.year, self.month, self.day, self.hour, self.minute, self.second, fraction, tz,
-        )
+        // NB: the `Display` implementation already writes a valid
+        //     `xsd:dateTime`, directly into a single buffer.
+        self.to_string()
     }
 }
 
@@ -333,8 +324,8 @@ impl<'i> FromPair<'i> for IsoTimezone {
     unsafe fn from_pair_unchecked(pair: Pair<'i, Rule>) -> Result<Self, SyntaxError> {
         use self::IsoTimezone::*;
 
-        let tag = pair.as_str().chars().next().unwrap();
-        if tag == 'Z' {
+        let tag = pair.as_str().as_bytes()[0];
+        if tag == b'Z' {
             return Ok(Utc);
         }
 
@@ -345,8 +336,8 @@ impl<'i> FromPair<'i> for IsoTimezone {
             .map(|p| u8::from_str_radix(p.as_str(), 10).unwrap());
 
         match tag {
-            '+' => Ok(Plus(hh, mm)),
-            '-' => Ok(Minus(hh, mm)),
+            b'+' => Ok(Plus(hh, mm)),
+            b'-' => Ok(Minus(hh, mm)),
             _ => unreachable!(),
         }
     }
@@ -7,6 +7,10 @@ use std::fmt::Error as FmtError;
 use std::fmt::Result as FmtResult;
 use std::fmt::Write;
 
+use crate::parser::QuickFind;
+
+use super::strings::escape_with;
+
 mod ident;
 mod prefix;
 mod prefixed;
@@ -26,35 +30,79 @@ pub use self::subclasses::SynonymTypeIdent;
 pub use self::unprefixed::UnprefixedIdent;
 pub use self::url::Url;
 
+/// The escape sequence of every byte to escape in an identifier.
+static ESCAPES: [Option<&str>; 256] = {
+    let mut table = [None; 256];
+    table[b'\r' as usize] = Some("\\r");
+    table[b'\n' as usize] = Some("\\n");
+    table[b'\x0c' as usize] = Some("\\f");
+    table[b' ' as usize] = Some("\\ ");
+    table[b'\t' as usize] = Some("\\t");
+    table[b':' as usize] = Some("\\:");
+    table[b'"' as usize] = Some("\\\"");
+    table[b'\\' as usize] = Some("\\\\");
+    table
+};
+
 fn escape<W: Write>(f: &mut W, s: &str) -> FmtResult {
-    s.chars().try_for_each(|char| match char {
-        '\r' => f.write_str("\\r"),
-        '\n' => f.write_str("\\n"),
-        '\u{000c}' => f.write_str("\\f"),
-        ' ' => f.write_str("\\ "),
-        '\t' => f.write_str("\\t"),
-        ':' => f.write_str("\\:"),
-        '"' => f.write_str("\\\""),
-        '\\' => f.write_str("\\\\"),
-        _ => f.write_char(char),
-    })
+    escape_with(f, s, &ESCAPES)
 }
 
 fn unescape<W: Write>(f: &mut W, s: &str) -> FmtResult {
-    let mut chars = s.chars();
-    while let Some(char) = chars.next() {
-        if char == '\\' {
-            match chars.next() {
-                Some('r') => f.write_char('\r')?,
-                Some('n') => f.write_char('\n')?,
-                Some('f') => f.write_char('\u{000c}')?,
-                Some('t') => f.write_char('\t')?,
-                Some(other) => f.write_char(other)?,
-                None => return Err(FmtError),
-            }
-        } else {
-            f.write_char(char)?;
+    // jump from one escape sequence to the next, copying the unescaped
+    // spans in between in a single write.
+    let mut rest = s;
+    while let Some(i) = rest.quickfind(b'\\') {
+        f.write_str(&rest[..i])?;
+        let mut chars = rest[i + 1..].chars();
+        match chars.next() {
+            Some('r') => f.write_char('\r')?,
+            Some('n') => f.write_char('\n')?,
+            Some('f') => f.write_char('\u{000c}')?,
+            Some('t') => f.write_char('\t')?,
+            Some(other) => f.write_char(other)?,
+            None => return Err(FmtError),
         }
+        rest = chars.as_str();
+    }
+    f.write_str(rest)
+}
+
+#[cfg(test)]
+mod tests {
+
+    use pretty_assertions::assert_eq;
+
+    #[test]
+    fn escape() {
+        let mut s = String::new();
+        super::escape(&mut s, "GO").unwrap();
+        assert_eq!(s, "GO");
+
+        s.clear();
+        super::escape(&mut s, "https://example.com").unwrap();
+        assert_eq!(s, "https\\://example.com");
+
+        s.clear();
+        super::escape(&mut s, "Copper(II) chloride\t\"ß\"\\").unwrap();
+        assert_eq!(s, "Copper(II)\\ chloride\\t\\\"ß\\\"\\\\");
+    }
+
+    #[test]
+    fn unescape() {
+        let mut s = String::new();
+        super::unescape(&mut s, "GO").unwrap();
+        assert_eq!(s, "GO");
+
+        s.clear();
+        super::unescape(&mut s, "https\\://example.com").unwrap();
+        assert_eq!(s, "https://example.com");
+
+        s.clear();
+        super::unescape(&mut s, "a\\ b\\tc\\\\").unwrap();
+        assert_eq!(s, "a b\tc\\");
+
+        s.clear();
+        assert!(super::unescape(&mut s, "trailing\\").is_err());
     }
-    Ok(())
 }
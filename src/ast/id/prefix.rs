@@ -10,7 +10,6 @@ use pest::iterators::Pair;
 use crate::ast::StringType;
 use crate::error::SyntaxError;
 use crate::parser::FromPair;
-use crate::parser::QuickFind;
 use crate::syntax::Rule;
 
 use super::escape;
@@ -18,12 +17,13 @@ use super::unescape;
 
 /// Return whether a prefix is canonical.
 pub fn is_canonical<S: AsRef<str>>(s: S) -> bool {
-    let string = s.as_ref();
-    let mut chars = string.chars();
-    if let Some(c) = chars.next() {
-        c.is_ascii_alphabetic() && chars.all(|ref c| char::is_ascii_alphanumeric(c))
-    } else {
-        false
+    // NB: a canonical prefix is ASCII-only, so it can be checked bytewise
+    //     without decoding the UTF-8 characters of the string.
+    match s.as_ref().as_bytes().split_first() {
+        Some((first, rest)) => {
+            first.is_ascii_alphabetic() && rest.iter().all(u8::is_ascii_alphanumeric)
+        }
+        None => false,
     }
 }
 
@@ -127,14 +127,14 @@ impl<'i> FromPair<'i> for IdentPrefix {
         // Bail out if the local prefix is canonical (alphanumeric only)
         let inner = pair.into_inner().next().unwrap();
         if inner.as_rule() == Rule::CanonicalIdPrefix {
-            return Ok(Self::new(inner.as_str().to_string()));
+            return Ok(Self::new(inner.as_str()));
         }
 
-        // Unescape the prefix if it was not produced by CanonicalIdPrefix.
-        let s = inner.as_str();
-        let escaped = s.quickcount(b'\\');
-        let mut local = String::with_capacity(s.len() + escaped);
-        unescape(&mut local, s).expect("fmt::Write cannot fail on a String");
+        // Unescape the prefix if it was not produced by CanonicalIdPrefix,
+        // writing directly to a `StringType` to avoid a heap allocation
+        // for short prefixes.
+        let mut local = StringType::new();
+        unescape(&mut local, inner.as_str()).expect("fmt::Write cannot fail on a String");
         // FIXME(@althonos): possible syntax issue, which uses a non-canonical
         //                   rule on canonical prefixes (workaround is to check
         //                   one more time if the prefix is canonical)
@@ -36,8 +36,10 @@ impl PrefixedIdent {
     /// assert_eq!(id1, id2);
     /// ```
     pub fn new(prefix: &str, local: &str) -> Self {
+        let mut data = StringType::from(prefix);
+        data.push_str(local);
         Self {
-            data: StringType::from(format!("{}{}", prefix, local)),
+            data,
             local_offset: prefix.len(),
         }
     }
@@ -57,7 +59,7 @@ impl PrefixedIdent {
     /// ```
     pub fn is_canonical(&self) -> bool {
         super::prefix::is_canonical(self.prefix())
-            && self.local().chars().all(|c| c.is_ascii_digit())
+            && self.local().bytes().all(|c| c.is_ascii_digit())
     }
 
     /// Get the prefix part of the identifier.
@@ -8,7 +8,6 @@ use pest::iterators::Pair;
 use crate::ast::StringType;
 use crate::error::SyntaxError;
 use crate::parser::FromPair;
-use crate::parser::QuickFind;
 use crate::syntax::Rule;
 
 use super::escape;
@@ -74,10 +73,8 @@ impl From<StringType> for UnprefixedIdent {
 impl<'i> FromPair<'i> for UnprefixedIdent {
     const RULE: Rule = Rule::UnprefixedId;
     unsafe fn from_pair_unchecked(pair: Pair<'i, Rule>) -> Result<Self, SyntaxError> {
-        let s = pair.as_str();
-        let escaped = s.quickcount(b'\\');
-        let mut local = String::with_capacity(s.len() + escaped);
-        unescape(&mut local, s).expect("fmt::Write cannot fail on a String");
+        let mut local = StringType::new();
+        unescape(&mut local, pair.as_str()).expect("fmt::Write cannot fail on a String");
         Ok(Self::new(local))
     }
 }
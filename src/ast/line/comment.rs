@@ -45,13 +45,7 @@ impl Display for Comment {
 impl<'i> FromPair<'i> for Comment {
     const RULE: Rule = Rule::Comment;
     unsafe fn from_pair_unchecked(pair: Pair<'i, Rule>) -> Result<Self, SyntaxError> {
-        let txt = pair
-            .into_inner()
-            .next()
-            .unwrap()
-            .as_str()
-            .trim()
-            .to_string();
+        let txt = pair.into_inner().next().unwrap().as_str().trim();
         Ok(Comment::new(txt))
     }
 }
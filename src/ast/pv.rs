@@ -209,7 +209,7 @@ impl<'i> FromPair<'i> for LiteralPropertyValue {
         let datatype = Ident::from_pair_unchecked(inner.next().unwrap())?;
         let desc = match second.as_rule() {
             Rule::QuotedString => QuotedString::from_pair_unchecked(second)?,
-            Rule::UnquotedPropertyValueTarget => QuotedString::new(second.as_str().to_string()),
+            Rule::UnquotedPropertyValueTarget => QuotedString::new(second.as_str()),
             _ => unreachable!(),
         };
 
@@ -242,6 +242,14 @@ mod tests {
         assert_eq!(actual, expected);
     }
 
+    #[test]
+    fn size_of() {
+        // both variants are boxed, so the enum is not bigger than a tagged
+        // pointer regardless of the size of `LiteralPropertyValue`.
+        let size = std::mem::size_of::<PropertyValue>();
+        assert!(size <= 2 * std::mem::size_of::<usize>());
+    }
+
     #[test]
     fn partial_cmp() {
         let l1 = PropertyValue::from_str("engaged_to heather").unwrap();
@@ -1,5 +1,28 @@
+use std::fmt::Result as FmtResult;
+use std::fmt::Write;
+
 mod quoted;
 mod unquoted;
 
 pub use self::quoted::*;
 pub use self::unquoted::*;
+
+/// Write `s` to `f`, replacing every byte with its sequence in `escapes`.
+///
+/// Escaped characters must be ASCII, so that they can be looked up bytewise
+/// and the spans in between copied with a single write.
+pub(crate) fn escape_with<W: Write>(
+    f: &mut W,
+    s: &str,
+    escapes: &[Option<&str>; 256],
+) -> FmtResult {
+    let mut start = 0;
+    for (i, byte) in s.bytes().enumerate() {
+        if let Some(escaped) = escapes[byte as usize] {
+            f.write_str(&s[start..i])?;
+            f.write_str(escaped)?;
+            start = i + 1;
+        }
+    }
+    f.write_str(&s[start..])
+}
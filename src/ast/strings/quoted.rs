@@ -12,6 +12,8 @@ use pest::iterators::Pair;
 
 use crate::ast::StringType;
 
+use super::escape_with;
+
 use crate::error::SyntaxError;
 use crate::parser::FromPair;
 use crate::parser::QuickFind;
@@ -19,15 +21,19 @@ use crate::syntax::Rule;
 
 // ---------------------------------------------------------------------------
 
+/// The escape sequence of every byte to escape in a quoted string.
+static ESCAPES: [Option<&str>; 256] = {
+    let mut table = [None; 256];
+    table[b'\r' as usize] = Some("\\r");
+    table[b'\n' as usize] = Some("\\n");
+    table[b'\x0c' as usize] = Some("\\f");
+    table[b'"' as usize] = Some("\\\"");
+    table[b'\\' as usize] = Some("\\\\");
+    table
+};
+
 fn escape<W: Write>(f: &mut W, s: &str) -> FmtResult {
-    s.chars().try_for_each(|char| match char {
-        '\r' => f.write_str("\\r"),
-        '\n' => f.write_str("\\n"),
-        '\u{000c}' => f.write_str("\\f"),
-        '"' => f.write_str("\\\""),
-        '\\' => f.write_str("\\\\"),
-        _ => f.write_char(char),
-    })
+    escape_with(f, s, &ESCAPES)
 }
 
 fn unescape<W: Write>(f: &mut W, s: &str) -> FmtResult {
@@ -249,4 +255,16 @@ mod tests {
         let expected = QuotedString::new(String::from("something in \"escaped\" quotes"));
         assert_eq!(expected, actual.unwrap());
     }
+
+    #[test]
+    fn to_string() {
+        let s = QuotedString::new("something in quotes");
+        assert_eq!(s.to_string(), "\"something in quotes\"");
+
+        let s = QuotedString::new("some \"escaped\" quotes\nand a ß\\");
+        assert_eq!(
+            s.to_string(),
+            "\"some \\\"escaped\\\" quotes\\nand a ß\\\\\""
+        );
+    }
 }
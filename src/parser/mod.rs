@@ -1,4 +1,34 @@
 //! Parser and parsing-related traits for the OBO format.
+//!
+//! # Streaming
+//! All parsers are iterators over the [`Frame`]s of an OBO document: the
+//! header frame is yielded first, followed by every entity frame as soon as
+//! it has been parsed. Iterating over a parser instead of collecting it into
+//! an [`OboDoc`] allows processing large ontologies one frame at a time. With
+//! the [`SequentialParser`], memory usage is then bounded by the size of the
+//! largest frame rather than by the size of the whole document:
+//! ```rust
+//! # extern crate fastobo;
+//! use std::fs::File;
+//! use std::io::BufReader;
+//!
+//! use fastobo::ast::Frame;
+//! use fastobo::parser::Parser;
+//! use fastobo::parser::SequentialParser;
+//!
+//! let reader = BufReader::new(File::open("tests/data/ms.obo").unwrap());
+//! let mut terms = 0;
+//! for result in SequentialParser::new(reader) {
+//!     if let Frame::Term(_) = result.unwrap() {
+//!         terms += 1;
+//!     }
+//! }
+//! assert!(terms > 0);
+//! ```
+//!
+//! [`Frame`]: ../ast/enum.Frame.html
+//! [`OboDoc`]: ../ast/struct.OboDoc.html
+//! [`SequentialParser`]: ./struct.SequentialParser.html
 
 use std::io::BufRead;
 
@@ -19,8 +19,7 @@ impl<T: AsRef<str>> QuickFind for T {
     }
 
     fn quickcount(&self, needle: u8) -> usize {
-        let c = char::from(needle);
-        self.as_ref().chars().filter(|&x| x == c).count()
+        self.as_ref().as_bytes().quickcount(needle)
     }
 }
 
@@ -22,6 +22,7 @@ use super::FromPair;
 pub struct SequentialParser<B: BufRead> {
     stream: B,
     line: String,
+    frame_lines: String,
     offset: usize,
     line_offset: usize,
     header: Option<Result<Frame, Error>>,
@@ -68,7 +69,6 @@ impl<B: BufRead> Iterator for SequentialParser<B> {
 
     fn next(&mut self) -> Option<Self::Item> {
         let mut l: &str;
-        let mut frame_lines = String::new();
         let mut local_line_offset = 0;
         let mut local_offset = 0;
 
@@ -76,9 +76,13 @@ impl<B: BufRead> Iterator for SequentialParser<B> {
             return Some(res);
         }
 
+        // Reuse the frame buffer from the previous call, so that its
+        // allocation is only grown up to the size of the largest frame.
+        self.frame_lines.clear();
+
         while !self.line.is_empty() {
             // Store the line in the frame lines and clear the buffer.
-            frame_lines.push_str(&self.line);
+            self.frame_lines.push_str(&self.line);
             self.line.clear();
 
             // Read the next line.
@@ -90,7 +94,7 @@ impl<B: BufRead> Iterator for SequentialParser<B> {
             l = self.line.trim_start();
             if l.starts_with('[') || self.line.is_empty() {
                 let res = unsafe {
-                    match Lexer::tokenize(Rule::EntitySingle, &frame_lines) {
+                    match Lexer::tokenize(Rule::EntitySingle, &self.frame_lines) {
                         Ok(mut pairs) => EntityFrame::from_pair_unchecked(pairs.next().unwrap())
                             .map_err(Error::from),
                         Err(e) => Err(Error::from(
@@ -171,6 +175,7 @@ impl<B: BufRead> Parser<B> for SequentialParser<B> {
         Self {
             stream,
             line,
+            frame_lines: String::new(),
             offset,
             line_offset,
             header,
@@ -1,4 +1,4 @@
-use std::collections::HashMap;
+use std::collections::BTreeMap;
 use std::io::BufRead;
 use std::io::BufReader;
 use std::num::NonZeroUsize;
@@ -74,7 +74,7 @@ pub struct ThreadedParser<B: BufRead> {
     ordered: bool,
     read_index: usize,
     sent_index: usize,
-    queue: HashMap<usize, Result<Frame, Error>>,
+    queue: BTreeMap<usize, Result<Frame, Error>>,
 }
 
 impl<B: BufRead> AsRef<B> for ThreadedParser<B> {
@@ -337,7 +337,7 @@ impl<B: BufRead> Parser<B> for ThreadedParser<B> {
             ordered: false,
             read_index: 0,
             sent_index: 1,
-            queue: HashMap::new(),
+            queue: BTreeMap::new(),
             state: State::Idle,
         }
     }
@@ -76,16 +76,18 @@ pub trait OboFrame {
     fn cardinality_check(&self) -> Result<(), CardinalityError> {
         use std::collections::HashMap;
 
-        // Group clauses by variant kind
-        let mut clause_index: HashMap<_, Vec<&Self::Clause>> = HashMap::new();
+        // Count clauses by variant kind
+        let mut clause_count: HashMap<_, (Cardinality, usize)> = HashMap::new();
         for clause in self.clauses_ref() {
-            clause_index.entry(clause.tag()).or_default().push(clause);
+            clause_count
+                .entry(clause.tag())
+                .or_insert_with(|| (clause.cardinality(), 0))
+                .1 += 1;
         }
 
         // Check each variant kind
-        for (tag, clauses) in clause_index {
-            let cardinality = clauses[0].cardinality();
-            if let Some(err) = cardinality.to_error(clauses.len(), tag) {
+        for (tag, (cardinality, n)) in clause_count {
+            if let Some(err) = cardinality.to_error(n, tag) {
                 return Err(err);
             }
         }